@@ -24,37 +24,79 @@ Usage:
 For more information, see README.md and TECHNICAL_SPECIFICATION.md
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 import random
+import re
+import string
 import subprocess
 import sys
 import time
-from datetime import datetime, timedelta
+from datetime import timedelta
 from pathlib import Path
-from typing import List, Tuple
-
-import pyautogui
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("codeweaver_bot.log"),
-        logging.StreamHandler(sys.stdout),
-    ],
-)
+from typing import FrozenSet, Iterator, List, Tuple
+
+import pyperclip
+from pyperclip import PyperclipException
+
+try:
+    import pygetwindow
+except (ImportError, NotImplementedError):  # Window queries are Windows/macOS only
+    pygetwindow = None
+
+# Configure logging: records are queued by the caller and written to the file
+# and console by a background listener thread, keeping log I/O off the bot loop.
+# All console output goes through the logger so lines stay in order.
+_log_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+_log_output_handlers = [
+    logging.FileHandler("codeweaver_bot.log"),
+    logging.StreamHandler(sys.stdout),
+]
+for _handler in _log_output_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_output_handlers)
+_log_listener.start()
+_log_listener_running = True
+
+
+def _stop_log_listener() -> None:
+    """Flush queued log records and stop the listener; safe to call twice."""
+    global _log_listener_running
+    if _log_listener_running:
+        _log_listener_running = False
+        _log_listener.stop()
+
+
+atexit.register(_stop_log_listener)
+
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
 # --- Security and Validation Constants ---
 MAX_FILENAME_LENGTH = 100
 MAX_PATH_LENGTH = 260  # Windows path limit
-ALLOWED_FILE_EXTENSIONS = {".py"}
-SAFE_FILENAME_CHARS = set(
-    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-."
+ALLOWED_FILE_EXTENSIONS = frozenset({".py"})
+_ALLOWED_EXT_TUPLE = tuple(sorted(ALLOWED_FILE_EXTENSIONS))  # for str.endswith
+SAFE_FILENAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-.")
+# Deletion table for str.translate covering every unsafe ASCII character
+_UNSAFE_TRANSLATE = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if chr(i) not in SAFE_FILENAME_CHARS)
 )
 
+# Parent-directory references and path separators, matched in one scan
+_PATH_TRAVERSAL_RE = re.compile(r"\.\.|[/\\]")
+
+# Shell metacharacters rejected in the VS Code executable path
+_DANGEROUS_CHARS_RE = re.compile(r"[&|;`$()<>\n\r]")
+
 # --- Configuration Constants ---
 DEFAULT_PAUSE_TIME = 0.8
 DEFAULT_RUNTIME_HOURS = 1
@@ -63,6 +105,11 @@ FILE_CREATION_TIMEOUT = 1.5
 SAVE_DIALOG_TIMEOUT = 2.5
 LOOP_INTERVAL = 8
 MAX_RETRY_ATTEMPTS = 3
+MAX_RETRY_DELAY = 30.0
+WINDOW_POLL_INTERVAL = 0.1
+TYPING_INTERVAL = 0.03  # Per-character delay when no clipboard is available
+SAVE_VERIFY_INTERVAL = 5  # Writes between on-disk checks of saved files
+VSCODE_WINDOW_TITLE = "Visual Studio Code"
 
 # Configuration settings
 PYAUTOGUI_PAUSE = DEFAULT_PAUSE_TIME
@@ -75,49 +122,107 @@ PROJECT_DIR = Path(__file__).parent.absolute()
 GENERATED_FILES_DIR = PROJECT_DIR / "generated_files"
 
 
+def _generated_files_prefix() -> str:
+    """Return GENERATED_FILES_DIR plus a separator as a plain string.
+
+    Read per call so save paths follow the directory the verifier scans;
+    str() of a Path is cached, so no Path object is built here.
+    """
+    return f"{GENERATED_FILES_DIR}{os.sep}"
+
+
+@functools.lru_cache(maxsize=128)
+def _sanitize_filename(func_name: str) -> str:
+    """Sanitize function name for safe filename generation.
+
+    The result depends only on ``func_name`` and the bot cycles through a
+    small fixed set of names, so results are memoized.
+    """
+    # Remove parentheses and replace spaces with underscores
+    sanitized = func_name.replace("()", "").replace(" ", "_").lower()
+
+    # Keep only safe characters (non-ASCII input falls back to the slow filter)
+    safe_chars = sanitized.translate(_UNSAFE_TRANSLATE)
+    if not safe_chars.isascii():
+        safe_chars = "".join(c for c in safe_chars if c in SAFE_FILENAME_CHARS)
+
+    # Ensure it's not empty and not too long
+    if not safe_chars:
+        safe_chars = "function"
+
+    return safe_chars[:50]  # Limit length
+
+
 class FileTracker:
     """Thread-safe file tracking to avoid global variables."""
 
     def __init__(self):
         self._counter = 1
         self._used_names = set()
+        self._unverified_names = set()
+
+    def get_unique_filename(self, func_name: str) -> Tuple[str, str]:
+        """Generate a unique filename with validation.
+
+        Returns:
+            Tuple[str, str]: The filename and its full path as a string
+        """
+        base_name = self._checked_base_name(func_name)
+
+        # The counter is monotonic, so each generated name is already unique
+        filename = self._numbered_filename(base_name, self._counter)
+        self._counter += 1
+        self._used_names.add(filename)
+        return filename, _generated_files_prefix() + filename
+
+    def get_unique_filenames(self, func_name: str, count: int) -> List[Tuple[str, str]]:
+        """Generate ``count`` consecutive unique filenames in one call.
+
+        Returns:
+            List[Tuple[str, str]]: (filename, full path) pairs in counter order
+        """
+        base_name = self._checked_base_name(func_name)
+        if count <= 0:
+            return []
+
+        start = self._counter
+        filenames = [
+            self._numbered_filename(base_name, number)
+            for number in range(start, start + count)
+        ]
+
+        self._counter = start + count
+        self._used_names.update(filenames)
+        prefix = _generated_files_prefix()
+        return [(name, prefix + name) for name in filenames]
 
-    def get_unique_filename(self, func_name: str) -> Tuple[str, Path]:
-        """Generate a unique filename with validation."""
+    @staticmethod
+    def _checked_base_name(func_name: str) -> str:
+        """Validate a function name and return its sanitized filename stem."""
         if not isinstance(func_name, str) or not func_name.strip():
             raise ValueError("Function name must be a non-empty string")
+        return _sanitize_filename(func_name)
 
-        # Sanitize function name
-        base_name = self._sanitize_filename(func_name)
-
-        # Generate unique filename
-        while True:
-            filename = f"{base_name}_example_{self._counter:03d}.py"
-
-            if self._is_valid_filename(filename) and filename not in self._used_names:
-                self._used_names.add(filename)
-                full_path = GENERATED_FILES_DIR / filename
-                self._counter += 1
-                return filename, full_path
+    @classmethod
+    def _numbered_filename(cls, base_name: str, number: int) -> str:
+        """Build the filename for ``number``, raising if it is not valid."""
+        filename = f"{base_name}_example_{number:03d}.py"
+        if not cls._is_valid_filename(filename):
+            raise ValueError(f"Generated filename is not valid: {filename}")
+        return filename
 
-            self._counter += 1
-            if self._counter > 9999:  # Prevent infinite loop
-                raise RuntimeError("Unable to generate unique filename")
+    # Expose the memoized module-level helper under its historical name
+    _sanitize_filename = staticmethod(_sanitize_filename)
 
-    @staticmethod
-    def _sanitize_filename(func_name: str) -> str:
-        """Sanitize function name for safe filename generation."""
-        # Remove parentheses and replace spaces with underscores
-        sanitized = func_name.replace("()", "").replace(" ", "_").lower()
-
-        # Keep only safe characters
-        safe_chars = "".join(c for c in sanitized if c in SAFE_FILENAME_CHARS)
+    def mark_saved(self, filename: str) -> None:
+        """Record that a save was issued for ``filename``, pending verification."""
+        self._unverified_names.add(filename)
 
-        # Ensure it's not empty and not too long
-        if not safe_chars:
-            safe_chars = "function"
-
-        return safe_chars[:50]  # Limit length
+    def take_unverified(self) -> FrozenSet[str]:
+        """Return the saved filenames not yet verified and forget them."""
+        names = frozenset(self._unverified_names)
+        self._unverified_names.clear()
+        return names
 
     @staticmethod
     def _is_valid_filename(filename: str) -> bool:
@@ -126,23 +231,46 @@ class FileTracker:
             return False
 
         # Check for path traversal attempts
-        if ".." in filename or "/" in filename or "\\" in filename:
+        if _PATH_TRAVERSAL_RE.search(filename):
             return False
 
         # Check file extension
-        if not any(filename.endswith(ext) for ext in ALLOWED_FILE_EXTENSIONS):
+        if not filename.endswith(_ALLOWED_EXT_TUPLE):
             return False
 
         return True
 
 
-# Initialize PyAutoGUI with secure settings
-pyautogui.PAUSE = PYAUTOGUI_PAUSE
-pyautogui.FAILSAFE = PYAUTOGUI_FAILSAFE
+# PyAutoGUI hooks into the display server on import, so it is loaded lazily
+# by _load_pyautogui() the first time GUI automation is actually needed
+pyautogui = None
+
+
+def _load_pyautogui() -> None:
+    """Import PyAutoGUI on first use and apply secure settings."""
+    global pyautogui
+    if pyautogui is not None:
+        return
+
+    import pyautogui as _pyautogui
+
+    _pyautogui.PAUSE = PYAUTOGUI_PAUSE
+    _pyautogui.FAILSAFE = PYAUTOGUI_FAILSAFE
+    pyautogui = _pyautogui
+
 
 # Initialize file tracker
 file_tracker = FileTracker()
 
+# Set once generated_files has been created and verified writable
+_dir_ready = False
+
+# (epoch second, formatted timestamp) reused by _now_stamp
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
+# Cleared by paste_text() the first time the clipboard cannot be used
+_clipboard_available = True
+
 # --- Enhanced Python Functions Repository ---
 FUNCTIONS: List[Tuple[str, str, str]] = [
     (
@@ -178,17 +306,65 @@ FUNCTIONS: List[Tuple[str, str, str]] = [
 ]
 
 
+def _build_content_template(
+    func_name: str, description: str, example: str
+) -> Tuple[str, str]:
+    """Render the static parts of a generated file around its timestamp.
+
+    Returns:
+        Tuple[str, str]: Text before and after the generation timestamp
+    """
+    header = f"# {func_name}: {description}\n# Generated by CodeWeaverBot on "
+    body = f"\n# Example:\n\n{example}\n\n# End of example"
+    return header, body
+
+
+def _is_valid_function_entry(entry: Tuple[str, ...]) -> bool:
+    """Check that a function entry holds three non-empty strings."""
+    return len(entry) == 3 and all(
+        isinstance(field, str) and field.strip() for field in entry
+    )
+
+
+# FUNCTIONS is fixed, so validate it once here instead of on every write
+for _entry in FUNCTIONS:
+    if not _is_valid_function_entry(_entry):
+        raise ValueError(f"Invalid FUNCTIONS entry: {_entry!r}")
+
+# Pre-rendered templates for the fixed function repository
+_CONTENT_TEMPLATES = {entry: _build_content_template(*entry) for entry in FUNCTIONS}
+
+
+def iter_functions() -> Iterator[Tuple[str, str, str]]:
+    """Yield FUNCTIONS entries forever, reshuffled on every full pass.
+
+    Every function is written once per pass, so coverage stays balanced
+    and the same example is never picked many times in a row.
+    """
+    rotation = list(FUNCTIONS)
+    while True:
+        random.shuffle(rotation)
+        yield from rotation
+
+
 def validate_vscode_executable(executable_path: str) -> bool:
     """Validate VS Code executable path for security."""
     if not isinstance(executable_path, str) or not executable_path.strip():
         return False
 
+    # Logged here rather than in the cached check so every rejection is reported
+    if not _is_safe_vscode_executable(executable_path):
+        logger.warning("Potentially dangerous VS Code path: %s", executable_path)
+        return False
+
+    return True
+
+
+@functools.lru_cache(maxsize=4)
+def _is_safe_vscode_executable(executable_path: str) -> bool:
+    """Check a non-empty executable path; memoized as it is re-checked per launch."""
     # Check for command injection attempts
-    dangerous_chars = ["&", "|", ";", "`", "$", "(", ")", "<", ">", "\n", "\r"]
-    if any(char in executable_path for char in dangerous_chars):
-        logger.warning(
-            "Potentially dangerous characters in VS Code path: %s", executable_path
-        )
+    if _DANGEROUS_CHARS_RE.search(executable_path):
         return False
 
     # Limit length to prevent buffer overflow attempts
@@ -218,7 +394,11 @@ def open_vscode_new_window() -> bool:
         # Prepare command arguments securely
         cmd_args = [VS_CODE_EXECUTABLE, "--new-window"]
 
-        # Use subprocess to open a new VS Code window with security considerations
+        windows_before = _count_vscode_windows()
+
+        # Use subprocess to open a new VS Code window with security considerations.
+        # VS Code is detached from the bot's process group so that Ctrl+C on the
+        # bot does not also take down the editor.
         if os.name == "nt":  # Windows
             # On Windows, use shell=False for security and provide full argument list
             subprocess.Popen(
@@ -226,14 +406,18 @@ def open_vscode_new_window() -> bool:
                 shell=False,  # More secure than shell=True
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
+                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
             )
         else:  # Linux/Mac
             subprocess.Popen(
-                cmd_args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                cmd_args,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
             )
 
         # Wait for VS Code to fully load
-        time.sleep(VSCODE_LAUNCH_TIMEOUT)
+        _wait_for_vscode_window(windows_before)
         logger.info("VS Code window opened successfully")
         return True
 
@@ -242,6 +426,38 @@ def open_vscode_new_window() -> bool:
         return _fallback_vscode_launch()
 
 
+def _count_vscode_windows() -> int:
+    """Count open VS Code windows, or -1 if windows cannot be queried."""
+    if pygetwindow is None:
+        return -1
+    try:
+        return len(pygetwindow.getWindowsWithTitle(VSCODE_WINDOW_TITLE))
+    except (RuntimeError, Exception) as e:
+        logger.debug("Unable to query VS Code windows: %s", e)
+        return -1
+
+
+def _wait_for_vscode_window(windows_before: int) -> None:
+    """Wait until a new VS Code window appears, up to VSCODE_LAUNCH_TIMEOUT.
+
+    Falls back to a fixed VSCODE_LAUNCH_TIMEOUT sleep when windows cannot be
+    queried on this platform.
+
+    Args:
+        windows_before: VS Code window count taken before launching
+    """
+    if windows_before < 0:
+        time.sleep(VSCODE_LAUNCH_TIMEOUT)
+        return
+
+    deadline = time.monotonic() + VSCODE_LAUNCH_TIMEOUT
+    while time.monotonic() < deadline:
+        if _count_vscode_windows() > windows_before:
+            return
+        time.sleep(WINDOW_POLL_INTERVAL)
+    logger.warning("VS Code window not detected after %ss", VSCODE_LAUNCH_TIMEOUT)
+
+
 def _fallback_vscode_launch() -> bool:
     """Fallback method for launching VS Code using Windows Run dialog.
 
@@ -250,6 +466,7 @@ def _fallback_vscode_launch() -> bool:
     """
     try:
         logger.info("Attempting fallback VS Code launch method...")
+        _load_pyautogui()
         pyautogui.hotkey("win", "r")  # Open Run dialog
         time.sleep(1)
 
@@ -271,7 +488,15 @@ def _fallback_vscode_launch() -> bool:
 
 
 def ensure_generated_files_dir() -> None:
-    """Ensure the generated_files directory exists with proper error handling."""
+    """Ensure the generated_files directory exists with proper error handling.
+
+    The directory is created and probed for write access only once per
+    process; later calls return immediately.
+    """
+    global _dir_ready
+    if _dir_ready:
+        return
+
     try:
         GENERATED_FILES_DIR.mkdir(parents=True, exist_ok=True)
         logger.info("Directory ready: %s", GENERATED_FILES_DIR)
@@ -282,6 +507,7 @@ def ensure_generated_files_dir() -> None:
             test_file.write_text("test")
             test_file.unlink()
             logger.debug("Write permissions verified")
+            _dir_ready = True
         except (OSError, PermissionError) as e:
             logger.error(
                 "No write permissions for directory %s: %s", GENERATED_FILES_DIR, e
@@ -293,6 +519,43 @@ def ensure_generated_files_dir() -> None:
         raise
 
 
+def _now_stamp() -> str:
+    """Return the current local time as ``YYYY-MM-DD HH:MM:SS``.
+
+    The formatted string is cached and only rebuilt when the second changes.
+    """
+    global _timestamp_cache
+    second = int(time.time())
+    if second != _timestamp_cache[0]:
+        _timestamp_cache = (
+            second,
+            time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)),
+        )
+    return _timestamp_cache[1]
+
+
+def paste_text(text: str) -> None:
+    """Insert text into the focused window via the clipboard.
+
+    Pasting transfers the whole buffer in one keystroke, whereas typing
+    costs a fixed delay per character. Without a usable clipboard (e.g.
+    Linux lacking xclip/xsel) the text is typed instead.
+    """
+    global _clipboard_available
+    _load_pyautogui()
+    if _clipboard_available:
+        try:
+            pyperclip.copy(text)
+        except PyperclipException as e:
+            logger.warning("Clipboard unavailable, typing text instead: %s", e)
+            _clipboard_available = False
+        else:
+            pyautogui.hotkey("ctrl", "v")
+            return
+
+    pyautogui.write(text, interval=TYPING_INTERVAL)
+
+
 def wait_for_save_dialog() -> None:
     """Wait for save dialog to appear and be ready for input."""
     time.sleep(SAVE_DIALOG_TIMEOUT)
@@ -309,34 +572,41 @@ def write_function_improved(func_name: str, description: str, example: str) -> b
     Returns:
         bool: True if file was successfully created, False otherwise
     """
-    if not all(
-        isinstance(arg, str) and arg.strip()
-        for arg in [func_name, description, example]
-    ):
+    if not _is_valid_function_entry((func_name, description, example)):
         logger.error("Invalid arguments provided to write_function_improved")
         return False
 
+    return _write_function(func_name, description, example)
+
+
+def _write_function(func_name: str, description: str, example: str) -> bool:
+    """Write a function example without re-validating the arguments.
+
+    Used directly by the bot loop, whose FUNCTIONS entries are validated
+    once at import time.
+    """
     try:
         logger.info("Creating example for %s...", func_name)
 
         # Create new file
+        _load_pyautogui()
         pyautogui.hotkey("ctrl", "n")
         time.sleep(FILE_CREATION_TIMEOUT)
 
         # Generate content with timestamp for better tracking
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        content = (
-            f"# {func_name}: {description}\n"
-            f"# Generated by CodeWeaverBot on {timestamp}\n"
-            f"# Example:\n\n{example}\n\n# End of example"
-        )
+        timestamp = _now_stamp()
+        template = _CONTENT_TEMPLATES.get((func_name, description, example))
+        if template is None:
+            template = _build_content_template(func_name, description, example)
+        header, body = template
+        content = header + timestamp + body
 
         # Validate content length to prevent excessive memory usage
         if len(content) > 10000:  # 10KB limit
             logger.warning("Content too large for %s, truncating...", func_name)
             content = content[:10000] + "\n# ... (truncated)"
 
-        pyautogui.write(content, interval=0.03)
+        paste_text(content)
         time.sleep(1)
 
         # Save the file
@@ -351,22 +621,19 @@ def write_function_improved(func_name: str, description: str, example: str) -> b
             return False
 
         # Validate path length
-        if len(str(full_path)) > MAX_PATH_LENGTH:
+        if len(full_path) > MAX_PATH_LENGTH:
             logger.error("Path too long: %s", full_path)
             return False
 
-        # Type the full path to save in the generated_files directory
-        pyautogui.write(str(full_path), interval=0.05)
+        # Paste the full path to save in the generated_files directory
+        paste_text(full_path)
         pyautogui.press("enter")
         time.sleep(FILE_CREATION_TIMEOUT)
 
-        # Verify file was created
-        if full_path.exists():
-            logger.info("Successfully created: %s in generated_files/", filename)
-            return True
-        else:
-            logger.warning("File %s was not created successfully", filename)
-            return False
+        # Saves are checked on disk in batches by verify_generated_files()
+        file_tracker.mark_saved(filename)
+        logger.info("Saved: %s in generated_files/", filename)
+        return True
 
     except (RuntimeError, Exception) as e:
         logger.error("PyAutoGUI error writing function %s: %s", func_name, e)
@@ -376,30 +643,75 @@ def write_function_improved(func_name: str, description: str, example: str) -> b
         return False
 
 
-def run_bot_improved(vscode_already_open: bool = False) -> None:
+def verify_generated_files() -> int:
+    """Check that files saved since the last check exist in generated_files.
+
+    Uses a single directory scan instead of one stat call per file. Each
+    saved file is checked once, so repeated calls never re-report it.
+
+    Returns:
+        int: Number of newly saved files that are missing on disk
+    """
+    expected = file_tracker.take_unverified()
+    if not expected:
+        return 0
+
+    try:
+        with os.scandir(GENERATED_FILES_DIR) as entries:
+            on_disk = {entry.name for entry in entries if entry.is_file()}
+    except OSError as e:
+        logger.error("Cannot scan %s: %s", GENERATED_FILES_DIR, e)
+        return len(expected)
+
+    missing = expected - on_disk
+    for filename in sorted(missing):
+        logger.warning("File %s was not created successfully", filename)
+    return len(missing)
+
+
+def _failure_backoff(consecutive_failures: int) -> float:
+    """Exponential backoff with jitter before retrying after a failure.
+
+    Args:
+        consecutive_failures: Number of failures in a row so far
+
+    Returns:
+        float: Seconds to wait, capped at MAX_RETRY_DELAY plus up to 1s jitter
+    """
+    return min(MAX_RETRY_DELAY, 2.0**consecutive_failures) + random.random()
+
+
+def run_bot_improved(vscode_already_open: bool = False) -> bool:
     """Run CodeWeaverBot with enhanced error handling and timing.
 
     Args:
         vscode_already_open: Whether VS Code is already open
+
+    Returns:
+        bool: False if VS Code could not be opened, True once the session ends
     """
     logger.info("Starting CodeWeaverBot for %s hour(s)...", TOTAL_RUNTIME_HOURS)
-    start_time = datetime.now()
-    end_time = start_time + timedelta(hours=TOTAL_RUNTIME_HOURS)
+    # Monotonic clock: cheap to read and immune to wall-clock adjustments
+    start_time = time.monotonic()
+    deadline = start_time + TOTAL_RUNTIME_HOURS * 3600
 
     # Open VS Code only if not already open
     if not vscode_already_open:
         if not open_vscode_new_window():
             logger.error("Failed to open VS Code. Exiting...")
-            return
+            return False
 
     successful_files = 0
     failed_files = 0
     consecutive_failures = 0
     max_consecutive_failures = 5
+    attempts = 0
+
+    function_cycle = iter_functions()
 
     logger.info("Starting file generation loop...")
 
-    while datetime.now() < end_time:
+    while time.monotonic() < deadline:
         try:
             # Safety check: stop if too many consecutive failures
             if consecutive_failures >= max_consecutive_failures:
@@ -409,24 +721,38 @@ def run_bot_improved(vscode_already_open: bool = False) -> None:
                 )
                 break
 
-            # Select a random function
-            func, desc, example = random.choice(FUNCTIONS)
+            # Select the next function from the shuffled rotation
+            func, desc, example = next(function_cycle)
 
             # Write the function example
-            if write_function_improved(func, desc, example):
+            if _write_function(func, desc, example):
                 successful_files += 1
                 consecutive_failures = 0  # Reset counter on success
             else:
                 failed_files += 1
                 consecutive_failures += 1
 
-            # Calculate remaining time
-            remaining_time = end_time - datetime.now()
+            # Saves that never reached disk count as failures, so a dead
+            # save dialog still trips the consecutive-failure breaker
+            attempts += 1
+            if attempts % SAVE_VERIFY_INTERVAL == 0:
+                missing = verify_generated_files()
+                successful_files -= missing
+                failed_files += missing
+                consecutive_failures += missing
+
             logger.info("Files created: %s, Failed: %s", successful_files, failed_files)
-            logger.info("Time remaining: %s", remaining_time)
+            remaining_seconds = max(0.0, deadline - time.monotonic())
+            logger.info("Time remaining: %s", timedelta(seconds=int(remaining_seconds)))
 
-            # Wait before next iteration
-            time.sleep(LOOP_INTERVAL)
+            # Wait before next iteration, backing off while writes keep failing;
+            # once the breaker has tripped, stop without waiting
+            if consecutive_failures >= max_consecutive_failures:
+                continue
+            if consecutive_failures:
+                time.sleep(_failure_backoff(consecutive_failures))
+            else:
+                time.sleep(LOOP_INTERVAL)
 
         except KeyboardInterrupt:
             logger.info("CodeWeaverBot stopped by user.")
@@ -435,26 +761,28 @@ def run_bot_improved(vscode_already_open: bool = False) -> None:
             logger.error("PyAutoGUI error: %s", e)
             failed_files += 1
             consecutive_failures += 1
-            time.sleep(5)  # Wait before retrying
-        except (OSError, PermissionError) as e:
-            logger.error("System error: %s", e)
-            failed_files += 1
-            consecutive_failures += 1
-            time.sleep(5)  # Wait before retrying
+            if consecutive_failures < max_consecutive_failures:
+                time.sleep(_failure_backoff(consecutive_failures))
+
+    # Check the saves made since the last batch
+    missing = verify_generated_files()
+    successful_files -= missing
+    failed_files += missing
 
     # Final statistics
-    total_runtime = datetime.now() - start_time
+    total_runtime = timedelta(seconds=int(time.monotonic() - start_time))
     logger.info("CodeWeaverBot session completed!")
     logger.info("Successfully created: %s files", successful_files)
     logger.info("Failed attempts: %s files", failed_files)
     logger.info("Total runtime: %s", total_runtime)
+    return True
 
 
 def preview_functions() -> None:
     """Preview all available functions."""
     logger.info("Available Python functions:")
     for i, (func, desc, _) in enumerate(FUNCTIONS, 1):
-        print(f"{i}. {func}: {desc}")
+        logger.info("%s. %s: %s", i, func, desc)
 
 
 def validate_environment() -> bool:
@@ -478,6 +806,7 @@ def validate_environment() -> bool:
 
         # Check PyAutoGUI functionality
         try:
+            _load_pyautogui()
             pyautogui.position()  # Test basic PyAutoGUI functionality
         except (RuntimeError, Exception) as e:
             logger.error("PyAutoGUI not functioning properly: %s", e)
@@ -504,15 +833,10 @@ def main() -> None:
 
         # Preview available functions
         preview_functions()
-        print()
-
-        # Test VS Code connection and start bot if successful
-        logger.info("Testing VS Code connection...")
-        if open_vscode_new_window():
-            logger.info("VS Code opened successfully. Starting CodeWeaverBot...")
-            time.sleep(2)
-            run_bot_improved(vscode_already_open=True)
-        else:
+
+        # Start the bot; it opens the VS Code window itself
+        logger.info("Starting CodeWeaverBot...")
+        if not run_bot_improved():
             logger.error(
                 "Failed to connect to VS Code. Please check installation and PATH."
             )
@@ -524,6 +848,9 @@ def main() -> None:
     except (OSError, RuntimeError, ValueError) as e:
         logger.error("Fatal error: %s", e)
         sys.exit(1)
+    finally:
+        # Flush queued records before sys.exit tears the interpreter down
+        _stop_log_listener()
 
 
 if __name__ == "__main__":
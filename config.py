@@ -11,8 +11,9 @@ Date: July 6, 2025
 """
 
 import os
+import string
 from pathlib import Path
-from typing import Set
+from typing import FrozenSet
 
 # --- Version Information ---
 VERSION = "2.0"
@@ -22,10 +23,13 @@ AUTHOR = "nkmalunga"
 # --- Security and Validation Constants ---
 MAX_FILENAME_LENGTH = 100
 MAX_PATH_LENGTH = 260  # Windows path limit
-ALLOWED_FILE_EXTENSIONS: Set[str] = {".py"}
-SAFE_FILENAME_CHARS = set(
-    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-."
+ALLOWED_FILE_EXTENSIONS: FrozenSet[str] = frozenset({".py"})
+_ALLOWED_EXT_TUPLE = tuple(sorted(ALLOWED_FILE_EXTENSIONS))  # for str.endswith
+SAFE_FILENAME_CHARS: FrozenSet[str] = frozenset(
+    string.ascii_letters + string.digits + "_-."
 )
+# Byte map for bytes.translate: anything left after deletion is unsafe
+_SAFE_FILENAME_BYTES = "".join(sorted(SAFE_FILENAME_CHARS)).encode("ascii")
 
 # --- Timing Constants (in seconds) ---
 DEFAULT_PAUSE_TIME = 0.8
@@ -54,6 +58,7 @@ VSCODE_ARGS = ["--new-window"]
 MAX_CONTENT_LENGTH = 10000  # 10KB limit for generated content
 MAX_DESCRIPTION_LENGTH = 500
 MAX_EXAMPLE_LENGTH = 5000
+_TRUNCATION_MARKER = "\n# ... (content truncated for safety)"
 
 # --- Logging Configuration ---
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -109,16 +114,18 @@ def is_safe_filename(filename: str) -> bool:
     if len(filename) > MAX_FILENAME_LENGTH:
         return False
 
-    # Check for path traversal attempts
-    if ".." in filename or "/" in filename or "\\" in filename:
+    # Check for path traversal attempts (separators fail the character check)
+    if ".." in filename:
         return False
 
     # Check file extension
-    if not any(filename.endswith(ext) for ext in ALLOWED_FILE_EXTENSIONS):
+    if not filename.endswith(_ALLOWED_EXT_TUPLE):
         return False
 
     # Check for dangerous characters
-    if not all(c in SAFE_FILENAME_CHARS for c in filename):
+    if not filename.isascii():
+        return False
+    if filename.encode("ascii").translate(None, _SAFE_FILENAME_BYTES):
         return False
 
     return True
@@ -136,4 +143,5 @@ def get_safe_content_length(content: str) -> str:
     if len(content) <= MAX_CONTENT_LENGTH:
         return content
 
-    return content[:MAX_CONTENT_LENGTH] + "\n# ... (content truncated for safety)"
+    # Slicing copies only the kept prefix, however large the input is
+    return content[:MAX_CONTENT_LENGTH] + _TRUNCATION_MARKER
@@ -16,8 +16,19 @@ Date: July 6, 2025
 """
 
 import argparse
+import importlib
 import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _import_test_module(module_name):
+    """Import a test module, returning None if it cannot be imported."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as e:
+        print(f"Warning: Could not import {module_name}: {e}")
+        return None
 
 
 def run_all_tests(verbose=False):
@@ -27,13 +38,13 @@ def run_all_tests(verbose=False):
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
 
-    for module_name in test_modules:
-        try:
-            module = __import__(module_name)
-            module_suite = loader.loadTestsFromModule(module)
-            suite.addTests(module_suite)
-        except ImportError as e:
-            print(f"Warning: Could not import {module_name}: {e}")
+    # Import test modules concurrently so their import-time I/O overlaps
+    with ThreadPoolExecutor(max_workers=len(test_modules)) as executor:
+        modules = list(executor.map(_import_test_module, test_modules))
+
+    for module in modules:
+        if module is not None:
+            suite.addTests(loader.loadTestsFromModule(module))
 
     verbosity = 2 if verbose else 1
     runner = unittest.TextTestRunner(verbosity=verbosity)
@@ -14,24 +14,82 @@ Version: 2.0
 Date: July 6, 2025
 """
 
+import logging
 import os
 import sys
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock, call, patch, MagicMock
 
-# Add the project directory to the path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+# Suppress logs during testing. Unlike a CRITICAL basicConfig level, this
+# also skips LogRecord creation for calls made while importing app.
+logging.disable(logging.CRITICAL)
 
+from pyperclip import PyperclipException
+
+import app
 import config
 from app import (
+    FUNCTIONS,
     FileTracker,
+    _failure_backoff,
+    _now_stamp,
+    _wait_for_vscode_window,
+    iter_functions,
+    validate_environment,
     validate_vscode_executable,
     ensure_generated_files_dir,
+    verify_generated_files,
     write_function_improved,
 )
 
+# The PyAutoGUI calls app.py makes. A plain Mock restricted to this spec is
+# cheaper to build than a MagicMock and rejects misspelled automation calls.
+_PYAUTOGUI_SPEC = ["hotkey", "press", "write", "position"]
+
+# Over-length inputs shared by the validation tests
+_TOO_LONG_NAME = "a" * (config.MAX_FILENAME_LENGTH + 1)
+_LONG_PATH = "x" * 600
+
+# Case tables for the table-driven validation tests; each case is reported
+# separately through subTest
+_SAFE_FILENAME_CASES = (
+    ("test.py", True),
+    ("len_example_001.py", True),
+    ("function_test.py", True),
+    ("../test.py", False),  # Path traversal
+    ("test.txt", False),  # Wrong extension
+    ("test<>.py", False),  # Invalid chars
+    ("a" * 200, False),  # Too long
+)
+_SANITIZE_CASES = (
+    ("len()", "len"),  # Parentheses removal
+    ("string method", "string_method"),  # Space replacement
+    ("test<>function", "testfunction"),  # Unsafe character removal
+    ("café()", "caf"),  # Non-ASCII character removal
+)
+_VALID_EXECUTABLES = (
+    "code",
+    "/usr/bin/code",
+    "C:\\Program Files\\Microsoft VS Code\\Code.exe",
+)
+_INVALID_EXECUTABLES = (
+    "",  # Empty
+    "   ",  # Whitespace only
+    "code & rm -rf /",  # Dangerous characters
+    "code | malicious",
+    "code; evil_command",
+    "code`whoami`",
+    _LONG_PATH,  # Too long
+)
+
+
+def _pyautogui_mock():
+    """Build a lightweight stand-in for the pyautogui module."""
+    return Mock(spec=_PYAUTOGUI_SPEC)
+
 
 class TestConfig(unittest.TestCase):
     """Test cases for the config module."""
@@ -48,7 +106,7 @@ class TestConfig(unittest.TestCase):
         self.assertGreater(config.MAX_FILENAME_LENGTH, 0)
         self.assertEqual(config.MAX_PATH_LENGTH, 260)  # Windows limit
         self.assertIn(".py", config.ALLOWED_FILE_EXTENSIONS)
-        self.assertIsInstance(config.SAFE_FILENAME_CHARS, set)
+        self.assertIsInstance(config.SAFE_FILENAME_CHARS, frozenset)
 
     def test_timing_constants(self):
         """Test timing configuration constants."""
@@ -83,22 +141,10 @@ class TestConfig(unittest.TestCase):
 
     def test_validate_config_with_invalid_values(self):
         """Test config validation with invalid values."""
-        # Test with monkey patching invalid values
-        original_runtime = config.DEFAULT_RUNTIME_HOURS
-        original_max_runtime = config.MAX_RUNTIME_HOURS
-
-        try:
-            # Test invalid runtime hours
-            config.DEFAULT_RUNTIME_HOURS = -1
-            self.assertFalse(config.validate_config())
-
-            config.DEFAULT_RUNTIME_HOURS = config.MAX_RUNTIME_HOURS + 1
-            self.assertFalse(config.validate_config())
-
-        finally:
-            # Restore original values
-            config.DEFAULT_RUNTIME_HOURS = original_runtime
-            config.MAX_RUNTIME_HOURS = original_max_runtime
+        # patch.object restores the constants even if an assertion fails
+        for invalid_runtime in (-1, config.MAX_RUNTIME_HOURS + 1):
+            with patch.object(config, "DEFAULT_RUNTIME_HOURS", invalid_runtime):
+                self.assertFalse(config.validate_config())
 
     def test_get_safe_runtime_hours(self):
         """Test safe runtime hours validation."""
@@ -114,16 +160,9 @@ class TestConfig(unittest.TestCase):
 
     def test_is_safe_filename(self):
         """Test filename safety validation."""
-        # Valid filenames
-        self.assertTrue(config.is_safe_filename("test.py"))
-        self.assertTrue(config.is_safe_filename("len_example_001.py"))
-        self.assertTrue(config.is_safe_filename("function_test.py"))
-
-        # Invalid filenames
-        self.assertFalse(config.is_safe_filename("../test.py"))  # Path traversal
-        self.assertFalse(config.is_safe_filename("test.txt"))  # Wrong extension
-        self.assertFalse(config.is_safe_filename("test<>.py"))  # Invalid chars
-        self.assertFalse(config.is_safe_filename("a" * 200))  # Too long
+        for filename, expected in _SAFE_FILENAME_CASES:
+            with self.subTest(filename=filename):
+                self.assertIs(config.is_safe_filename(filename), expected)
 
     def test_get_safe_content_length(self):
         """Test content length safety validation."""
@@ -156,38 +195,46 @@ class TestFileTracker(unittest.TestCase):
         self.assertTrue(filename.endswith(".py"))
         self.assertIn("len", filename)
         self.assertIn("001", filename)
-        self.assertIsInstance(path, Path)
+        self.assertIsInstance(path, str)
+        self.assertEqual(Path(path), config.GENERATED_FILES_DIR / filename)
+
+    def test_get_unique_filename_follows_generated_files_dir(self):
+        """Test that paths track GENERATED_FILES_DIR when it is rebound."""
+        other_dir = Path(tempfile.gettempdir(), "codeweaver_generated")
+        with patch.object(app, "GENERATED_FILES_DIR", other_dir):
+            filename, path = self.tracker.get_unique_filename("len()")
+        self.assertEqual(Path(path), other_dir / filename)
 
     def test_get_unique_filename_increment(self):
         """Test that filenames increment properly."""
         filename1, _ = self.tracker.get_unique_filename("print()")
-        filename2, _ = self.tracker.get_unique_filename("print()")
+        ((filename2, _),) = self.tracker.get_unique_filenames("print()", 1)
 
         self.assertNotEqual(filename1, filename2)
         self.assertIn("001", filename1)
         self.assertIn("002", filename2)
 
+    def test_get_unique_filename_repeated_calls(self):
+        """Test that one-at-a-time generation never repeats a name."""
+        filenames = [self.tracker.get_unique_filename("len()")[0] for _ in range(50)]
+
+        self.assertEqual(len(set(filenames)), len(filenames))
+        self.assertEqual(self.tracker._used_names, set(filenames))
+
     def test_get_unique_filename_collision_prevention(self):
         """Test collision prevention in filename generation."""
-        filenames = set()
-        for i in range(10):
-            filename, _ = self.tracker.get_unique_filename("test()")
-            self.assertNotIn(filename, filenames)
-            filenames.add(filename)
+        count = 10000
+        filenames = {
+            name for name, _ in self.tracker.get_unique_filenames("test()", count)
+        }
+        self.assertEqual(len(filenames), count)
+        self.assertEqual(self.tracker._used_names, filenames)
 
     def test_sanitize_filename(self):
         """Test filename sanitization."""
-        # Test parentheses removal
-        result = FileTracker._sanitize_filename("len()")
-        self.assertEqual(result, "len")
-
-        # Test space replacement
-        result = FileTracker._sanitize_filename("string method")
-        self.assertEqual(result, "string_method")
-
-        # Test unsafe character removal
-        result = FileTracker._sanitize_filename("test<>function")
-        self.assertEqual(result, "testfunction")
+        for func_name, expected in _SANITIZE_CASES:
+            with self.subTest(func_name=func_name):
+                self.assertEqual(FileTracker._sanitize_filename(func_name), expected)
 
     def test_sanitize_filename_empty_input(self):
         """Test sanitization with empty or invalid input."""
@@ -203,8 +250,7 @@ class TestFileTracker(unittest.TestCase):
         self.assertTrue(FileTracker._is_valid_filename("test.py"))
 
         # Too long
-        long_name = "a" * (config.MAX_FILENAME_LENGTH + 1)
-        self.assertFalse(FileTracker._is_valid_filename(long_name))
+        self.assertFalse(FileTracker._is_valid_filename(_TOO_LONG_NAME))
 
         # Path traversal
         self.assertFalse(FileTracker._is_valid_filename("../test.py"))
@@ -227,27 +273,22 @@ class TestVSCodeValidation(unittest.TestCase):
 
     def test_validate_vscode_executable_valid(self):
         """Test validation with valid executables."""
-        self.assertTrue(validate_vscode_executable("code"))
-        self.assertTrue(validate_vscode_executable("/usr/bin/code"))
-        self.assertTrue(
-            validate_vscode_executable("C:\\Program Files\\Microsoft VS Code\\Code.exe")
-        )
+        for executable in _VALID_EXECUTABLES:
+            with self.subTest(executable=executable):
+                self.assertTrue(validate_vscode_executable(executable))
 
     def test_validate_vscode_executable_invalid(self):
         """Test validation with invalid executables."""
-        # Empty or None
-        self.assertFalse(validate_vscode_executable(""))
-        self.assertFalse(validate_vscode_executable("   "))
-
-        # Dangerous characters
-        self.assertFalse(validate_vscode_executable("code & rm -rf /"))
-        self.assertFalse(validate_vscode_executable("code | malicious"))
-        self.assertFalse(validate_vscode_executable("code; evil_command"))
-        self.assertFalse(validate_vscode_executable("code`whoami`"))
+        for executable in _INVALID_EXECUTABLES:
+            with self.subTest(executable=executable[:40]):
+                self.assertFalse(validate_vscode_executable(executable))
 
-        # Too long
-        long_path = "x" * 600
-        self.assertFalse(validate_vscode_executable(long_path))
+    @patch.object(app.logger, "warning")
+    def test_validate_vscode_executable_logs_every_rejection(self, mock_warning):
+        """Test that cached rejections are still reported on each call."""
+        for _ in range(2):
+            self.assertFalse(validate_vscode_executable("code; rm -rf /"))
+        self.assertEqual(mock_warning.call_count, 2)
 
     def test_validate_vscode_executable_type_error(self):
         """Test validation with wrong type input."""
@@ -256,35 +297,162 @@ class TestVSCodeValidation(unittest.TestCase):
         self.assertFalse(validate_vscode_executable(["code"]))
 
 
+class TestLazyImports(unittest.TestCase):
+    """Test that GUI automation is only imported when needed."""
+
+    @patch.object(app, "pyautogui", None)
+    def test_load_pyautogui_applies_settings(self):
+        """Test that the lazy import applies the secure PyAutoGUI settings."""
+        fake_pyautogui = Mock()
+        with patch.dict(sys.modules, {"pyautogui": fake_pyautogui}):
+            app._load_pyautogui()
+
+        self.assertIs(app.pyautogui, fake_pyautogui)
+        self.assertEqual(fake_pyautogui.PAUSE, app.PYAUTOGUI_PAUSE)
+        self.assertTrue(fake_pyautogui.FAILSAFE)
+
+
+class TestVSCodeLaunch(unittest.TestCase):
+    """Test cases for waiting on the VS Code window after launch."""
+
+    @patch.object(app.time, "sleep")
+    @patch.object(app, "pygetwindow")
+    def test_wait_returns_when_new_window_appears(self, mock_gw, mock_sleep):
+        """Test that polling stops as soon as a new window is detected."""
+        mock_gw.getWindowsWithTitle.side_effect = [[], [], ["window"]]
+
+        _wait_for_vscode_window(0)
+        self.assertEqual(mock_gw.getWindowsWithTitle.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch.object(app.time, "sleep")
+    def test_wait_falls_back_to_fixed_sleep(self, mock_sleep):
+        """Test the fixed delay when windows cannot be queried."""
+        _wait_for_vscode_window(-1)
+        mock_sleep.assert_called_once_with(config.VSCODE_LAUNCH_TIMEOUT)
+
+
+class TestTimestamp(unittest.TestCase):
+    """Test cases for the cached timestamp helper."""
+
+    @patch.object(app, "_timestamp_cache", (-1, ""))
+    @patch.object(app.time, "time")
+    def test_now_stamp_cached_within_second(self, mock_time):
+        """Test that the stamp is only reformatted when the second changes."""
+        mock_time.return_value = 1_700_000_000.2
+        first = _now_stamp()
+        self.assertRegex(first, r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$")
+
+        with patch.object(app.time, "strftime") as mock_strftime:
+            mock_time.return_value = 1_700_000_000.9
+            self.assertEqual(_now_stamp(), first)
+            mock_strftime.assert_not_called()
+
+        mock_time.return_value = 1_700_000_001.0
+        self.assertNotEqual(_now_stamp(), first)
+
+
+class TestRetryBackoff(unittest.TestCase):
+    """Test cases for the retry delay after failures."""
+
+    def test_failure_backoff_grows_and_caps(self):
+        """Test exponential growth, jitter bounds and the upper cap."""
+        for failures, base in [(1, 2.0), (3, 8.0), (10, 30.0)]:
+            delay = _failure_backoff(failures)
+            self.assertGreaterEqual(delay, base)
+            self.assertLess(delay, base + 1.0)
+
+
+class TestBotLoop(unittest.TestCase):
+    """Test cases for the main bot loop."""
+
+    @patch.object(app, "TOTAL_RUNTIME_HOURS", 0.001)  # Bounds the loop to 3.6s
+    @patch.object(app.time, "sleep")
+    @patch.object(app.logger, "info")
+    @patch.object(app, "verify_generated_files")
+    @patch.object(app, "_write_function", return_value=True)
+    def test_missing_saves_trip_failure_breaker(
+        self, mock_write, mock_verify, mock_info, mock_sleep
+    ):
+        """Test that saves which never reach disk stop the bot."""
+        # The first batch of "successful" writes is missing on disk, and the
+        # final check after the loop has nothing new to report
+        mock_verify.side_effect = [app.SAVE_VERIFY_INTERVAL, 0]
+
+        self.assertTrue(app.run_bot_improved(vscode_already_open=True))
+        self.assertEqual(mock_write.call_count, app.SAVE_VERIFY_INTERVAL)
+        self.assertIn(call("Successfully created: %s files", 0), mock_info.mock_calls)
+        self.assertIn(
+            call("Failed attempts: %s files", app.SAVE_VERIFY_INTERVAL),
+            mock_info.mock_calls,
+        )
+
+    @patch.object(app, "TOTAL_RUNTIME_HOURS", 0.001)  # Bounds the loop to 3.6s
+    @patch.object(app.time, "sleep")
+    @patch.object(app, "_failure_backoff", side_effect=float)
+    @patch.object(app, "verify_generated_files", return_value=0)
+    @patch.object(app, "_write_function", return_value=False)
+    def test_failed_writes_back_off_then_stop_without_waiting(
+        self, mock_write, mock_verify, mock_backoff, mock_sleep
+    ):
+        """Test backoff between failed writes and no wait once the breaker trips."""
+        self.assertTrue(app.run_bot_improved(vscode_already_open=True))
+
+        self.assertEqual(mock_write.call_count, 5)
+        # Backoff after failures 1-4; the fifth failure stops the bot at once
+        self.assertEqual(
+            mock_sleep.call_args_list, [call(1.0), call(2.0), call(3.0), call(4.0)]
+        )
+
+
 class TestDirectoryManagement(unittest.TestCase):
     """Test cases for directory management functions."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory shared by the whole class."""
+        cls._temp_dir = tempfile.TemporaryDirectory()
+        cls.test_dir = cls._temp_dir.name
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary directory."""
+        cls._temp_dir.cleanup()
+
     def setUp(self):
-        """Set up test fixtures with temporary directory."""
-        self.test_dir = tempfile.mkdtemp()
+        """Set up test fixtures."""
         self.original_generated_dir = config.GENERATED_FILES_DIR
 
+        # Force every test to go through the full create-and-probe path
+        dir_ready_patcher = patch.object(app, "_dir_ready", False)
+        dir_ready_patcher.start()
+        self.addCleanup(dir_ready_patcher.stop)
+
     def tearDown(self):
         """Clean up test fixtures."""
         config.GENERATED_FILES_DIR = self.original_generated_dir
 
-    @patch("app.GENERATED_FILES_DIR")
+    @patch.object(app, "GENERATED_FILES_DIR")
     def test_ensure_generated_files_dir_success(self, mock_dir):
         """Test successful directory creation."""
         mock_dir.mkdir = Mock()
         mock_dir.exists.return_value = True
 
-        # Mock the test file operations
-        test_file_mock = Mock()
-        test_file_mock.write_text = Mock()
-        test_file_mock.unlink = Mock()
-        mock_dir.__truediv__ = Mock(return_value=test_file_mock)
+        # Stand-in for the probe file; its calls are never inspected
+        test_file_stub = SimpleNamespace(
+            write_text=lambda _text: None, unlink=lambda: None
+        )
+        mock_dir.__truediv__ = Mock(return_value=test_file_stub)
 
         # Should not raise an exception
         ensure_generated_files_dir()
         mock_dir.mkdir.assert_called_once_with(parents=True, exist_ok=True)
 
-    @patch("app.GENERATED_FILES_DIR")
+        # A second call should reuse the verified state
+        ensure_generated_files_dir()
+        mock_dir.mkdir.assert_called_once()
+
+    @patch.object(app, "GENERATED_FILES_DIR")
     def test_ensure_generated_files_dir_permission_error(self, mock_dir):
         """Test directory creation with permission error."""
         mock_dir.mkdir.side_effect = PermissionError("Permission denied")
@@ -292,34 +460,89 @@ class TestDirectoryManagement(unittest.TestCase):
         with self.assertRaises(PermissionError):
             ensure_generated_files_dir()
 
+    @patch.object(app, "GENERATED_FILES_DIR")
+    def test_ensure_generated_files_dir_retries_after_failed_probe(self, mock_dir):
+        """Test that a failed write probe is not cached as success."""
+        test_file_mock = Mock()
+        test_file_mock.write_text.side_effect = PermissionError("Read-only")
+        mock_dir.__truediv__ = Mock(return_value=test_file_mock)
 
+        for _ in range(2):
+            with self.assertRaises(PermissionError):
+                ensure_generated_files_dir()
+        self.assertEqual(mock_dir.mkdir.call_count, 2)
+
+    def test_verify_generated_files_reports_missing(self):
+        """Test batch verification of saved files against the directory."""
+        tracker = FileTracker()
+        saved, _ = tracker.get_unique_filename("len()")
+        lost, _ = tracker.get_unique_filename("str()")  # Never written to disk
+        tracker.get_unique_filename("max()")  # Allocated but never saved
+        tracker.mark_saved(saved)
+        tracker.mark_saved(lost)
+        Path(self.test_dir, saved).write_text("# saved")
+
+        with patch.object(
+            app, "GENERATED_FILES_DIR", Path(self.test_dir)
+        ), patch.object(app, "file_tracker", tracker):
+            self.assertEqual(verify_generated_files(), 1)
+            # Files already checked are not reported again
+            self.assertEqual(verify_generated_files(), 0)
+
+
+@patch.object(app, "pyautogui", new_callable=_pyautogui_mock)
+@patch.object(app, "pyperclip")
+@patch.object(app, "file_tracker")
+@patch.object(app.time, "sleep")
 class TestContentGeneration(unittest.TestCase):
     """Test cases for content generation functions."""
 
-    @patch("app.pyautogui")
-    @patch("app.file_tracker")
-    @patch("app.time.sleep")
     def test_write_function_improved_success(
-        self, mock_sleep, mock_tracker, mock_pyautogui
+        self, mock_sleep, mock_tracker, mock_pyperclip, mock_pyautogui
     ):
         """Test successful function writing."""
         # Setup mocks
-        mock_tracker.get_unique_filename.return_value = ("test.py", Path("test.py"))
-        mock_path = Mock()
-        mock_path.exists.return_value = True
+        mock_path = str(Path("generated_files", "test.py"))
         mock_tracker.get_unique_filename.return_value = ("test.py", mock_path)
 
-        # Mock PyAutoGUI calls
-        mock_pyautogui.hotkey = Mock()
-        mock_pyautogui.write = Mock()
-        mock_pyautogui.press = Mock()
-
         result = write_function_improved(
             "len()", "Test function", "print(len([1,2,3]))"
         )
         self.assertTrue(result)
+        mock_pyautogui.write.assert_not_called()
+        mock_pyperclip.copy.assert_called_with(mock_path)
+        mock_tracker.mark_saved.assert_called_once_with("test.py")
+
+    @patch.object(app, "_clipboard_available", True)
+    def test_paste_text_types_without_clipboard(
+        self, mock_sleep, mock_tracker, mock_pyperclip, mock_pyautogui
+    ):
+        """Test the typing fallback when no clipboard mechanism exists."""
+        mock_pyperclip.copy.side_effect = PyperclipException("no xclip")
+
+        for text in ("first", "second"):
+            app.paste_text(text)
+            mock_pyautogui.write.assert_called_with(text, interval=app.TYPING_INTERVAL)
+
+        # The clipboard is only probed once, and never pasted from
+        mock_pyperclip.copy.assert_called_once_with("first")
+        mock_pyautogui.hotkey.assert_not_called()
 
-    def test_write_function_improved_invalid_input(self):
+    def test_write_function_improved_path_too_long(
+        self, mock_sleep, mock_tracker, mock_pyperclip, mock_pyautogui
+    ):
+        """Test that a rejected path is not tracked as a saved file."""
+        mock_tracker.get_unique_filename.return_value = ("test.py", _LONG_PATH)
+
+        result = write_function_improved(
+            "len()", "Test function", "print(len([1,2,3]))"
+        )
+        self.assertFalse(result)
+        mock_tracker.mark_saved.assert_not_called()
+
+    def test_write_function_improved_invalid_input(
+        self, mock_sleep, mock_tracker, mock_pyperclip, mock_pyautogui
+    ):
         """Test function writing with invalid input."""
         # Empty strings
         self.assertFalse(write_function_improved("", "desc", "example"))
@@ -330,13 +553,14 @@ class TestContentGeneration(unittest.TestCase):
         self.assertFalse(write_function_improved(None, "desc", "example"))
         self.assertFalse(write_function_improved("func", 123, "example"))
 
-    @patch("app.pyautogui")
-    @patch("app.file_tracker")
+        # Rejected before any GUI automation happens
+        mock_pyautogui.hotkey.assert_not_called()
+
     def test_write_function_improved_pyautogui_error(
-        self, mock_tracker, mock_pyautogui
+        self, mock_sleep, mock_tracker, mock_pyperclip, mock_pyautogui
     ):
         """Test function writing with PyAutoGUI error."""
-        mock_tracker.get_unique_filename.return_value = ("test.py", Path("test.py"))
+        mock_tracker.get_unique_filename.return_value = ("test.py", "test.py")
         mock_pyautogui.hotkey.side_effect = RuntimeError("PyAutoGUI error")
 
         result = write_function_improved(
@@ -348,51 +572,48 @@ class TestContentGeneration(unittest.TestCase):
 class TestEnvironmentValidation(unittest.TestCase):
     """Test cases for environment validation."""
 
-    @patch("app.validate_vscode_executable")
-    @patch("app.ensure_generated_files_dir")
-    @patch("app.pyautogui.position")
-    def test_validate_environment_success(
-        self, mock_position, mock_ensure_dir, mock_validate_vs
-    ):
+    @patch.multiple(
+        app,
+        validate_vscode_executable=Mock(return_value=True),
+        ensure_generated_files_dir=Mock(return_value=None),
+        pyautogui=_pyautogui_mock(),
+    )
+    def test_validate_environment_success(self):
         """Test successful environment validation."""
-        mock_validate_vs.return_value = True
-        mock_ensure_dir.return_value = None
-        mock_position.return_value = (100, 100)
-
-        from app import validate_environment
+        app.pyautogui.position.return_value = (100, 100)
 
         self.assertTrue(validate_environment())
 
-    @patch("app.validate_vscode_executable")
-    def test_validate_environment_invalid_vscode(self, mock_validate_vs):
+    @patch.multiple(app, validate_vscode_executable=Mock(return_value=False))
+    def test_validate_environment_invalid_vscode(self):
         """Test environment validation with invalid VS Code."""
-        mock_validate_vs.return_value = False
-
-        from app import validate_environment
-
         self.assertFalse(validate_environment())
 
-    @patch("app.validate_vscode_executable")
-    @patch("app.ensure_generated_files_dir")
-    def test_validate_environment_directory_error(
-        self, mock_ensure_dir, mock_validate_vs
-    ):
+    @patch.multiple(
+        app,
+        validate_vscode_executable=Mock(return_value=True),
+        ensure_generated_files_dir=Mock(
+            side_effect=PermissionError("Cannot create directory")
+        ),
+    )
+    def test_validate_environment_directory_error(self):
         """Test environment validation with directory creation error."""
-        mock_validate_vs.return_value = True
-        mock_ensure_dir.side_effect = PermissionError("Cannot create directory")
-
-        from app import validate_environment
-
         self.assertFalse(validate_environment())
 
+    @patch.object(app, "_stop_log_listener")
+    @patch.object(app, "validate_environment", return_value=False)
+    def test_main_flushes_logs_before_exit(self, mock_validate, mock_stop):
+        """Test that main stops the log listener before sys.exit unwinds."""
+        with self.assertRaises(SystemExit):
+            app.main()
+        mock_stop.assert_called_once_with()
+
 
 class TestIntegration(unittest.TestCase):
     """Integration tests for CodeWeaverBot."""
 
     def test_functions_list_integrity(self):
         """Test that the FUNCTIONS list is properly structured."""
-        from app import FUNCTIONS
-
         self.assertIsInstance(FUNCTIONS, list)
         self.assertGreater(len(FUNCTIONS), 0)
 
@@ -407,6 +628,13 @@ class TestIntegration(unittest.TestCase):
             self.assertGreater(len(description.strip()), 0)
             self.assertGreater(len(example.strip()), 0)
 
+    def test_iter_functions_balanced_passes(self):
+        """Test that each pass of the rotation covers every function once."""
+        cycle = iter_functions()
+        for _ in range(3):
+            one_pass = [next(cycle) for _ in FUNCTIONS]
+            self.assertCountEqual(one_pass, FUNCTIONS)
+
     def test_config_integration(self):
         """Test integration between config and app modules."""
         # Test that config constants are accessible and valid
@@ -419,19 +647,17 @@ class TestIntegration(unittest.TestCase):
     def test_file_tracker_with_config(self):
         """Test FileTracker integration with config constants."""
         tracker = FileTracker()
-        filename, path = tracker.get_unique_filename("test")
+        max_length = config.MAX_FILENAME_LENGTH
+        is_safe = config.is_safe_filename
 
-        # Should respect config limits
-        self.assertLessEqual(len(filename), config.MAX_FILENAME_LENGTH)
-        self.assertTrue(config.is_safe_filename(filename))
+        # Every name the bot can generate should respect config limits
+        for func_name in ["test"] + [func for func, _, _ in FUNCTIONS]:
+            filename, _ = tracker.get_unique_filename(func_name)
+            self.assertLessEqual(len(filename), max_length)
+            self.assertTrue(is_safe(filename), filename)
 
 
 if __name__ == "__main__":
-    # Configure test logging
-    import logging
-
-    logging.basicConfig(level=logging.CRITICAL)  # Suppress logs during testing
-
     # Create test suite
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
@@ -441,6 +667,11 @@ if __name__ == "__main__":
         TestConfig,
         TestFileTracker,
         TestVSCodeValidation,
+        TestLazyImports,
+        TestVSCodeLaunch,
+        TestTimestamp,
+        TestRetryBackoff,
+        TestBotLoop,
         TestDirectoryManagement,
         TestContentGeneration,
         TestEnvironmentValidation,